@@ -77,6 +77,7 @@ func Factory(ctx context.Context, conf *logical.BackendConfig) (logical.Backend,
 		Paths: framework.PathAppend(
 			b.pathConfig(),
 			b.pathEncrypt(),
+			b.pathEncryptBatch(),
 		),
 	}
 
@@ -5,6 +5,8 @@ package plugin
 
 import (
 	"context"
+	"encoding/base64"
+	"encoding/binary"
 	"encoding/json"
 	"fmt"
 	"math"
@@ -25,6 +27,10 @@ func (b *vectorBackend) pathEncrypt() []*framework.Path {
 					Type:        framework.TypeSlice,
 					Description: "Embedding vector to encrypt (array of floats).",
 				},
+				"vector_b64": {
+					Type:        framework.TypeString,
+					Description: "Embedding vector to encrypt, base64-encoded little-endian float32. Takes precedence over 'vector'.",
+				},
 			},
 			Operations: map[logical.Operation]framework.OperationHandler{
 				logical.CreateOperation: &framework.PathOperation{
@@ -55,11 +61,24 @@ func (b *vectorBackend) handleEncryptVector(ctx context.Context, req *logical.Re
 		}
 	}()
 
-	// Parse and validate input vector.
-	rawVector := data.Get("vector")
-	vector, err := parseVector(rawVector)
-	if err != nil {
-		return nil, err
+	// Parse and validate input vector. A base64-encoded float32 payload
+	// (vector_b64) avoids the per-element JSON float cost at large
+	// dimensions; the JSON 'vector' field remains the documented API.
+	var vector []float64
+	var wantB64 bool
+	if b64, ok := data.Get("vector_b64").(string); ok && b64 != "" {
+		var err error
+		vector, err = decodeVectorB64(b64)
+		if err != nil {
+			return nil, err
+		}
+		wantB64 = true
+	} else {
+		var err error
+		vector, err = parseVector(data.Get("vector"))
+		if err != nil {
+			return nil, err
+		}
 	}
 
 	// Get cached matrix and config (narrow lock scope - lock released after pointer copy).
@@ -68,6 +87,67 @@ func (b *vectorBackend) handleEncryptVector(ctx context.Context, req *logical.Re
 		return nil, err
 	}
 
+	// Audit Logging: Log request metadata (NOT the vector content).
+	b.Logger().Info("vector encryption request",
+		"dimension", cfg.Dimension,
+		"client_id", req.ClientToken)
+
+	resultCiphertext, err := b.encryptOne(matrix, cfg, vector)
+	if err != nil {
+		return nil, err
+	}
+
+	// Answer in the encoding the caller used.
+	if wantB64 {
+		return &logical.Response{
+			Data: map[string]interface{}{
+				"ciphertext_b64": encodeVectorB64(resultCiphertext),
+			},
+		}, nil
+	}
+
+	return &logical.Response{
+		Data: map[string]interface{}{
+			"ciphertext": resultCiphertext,
+		},
+	}, nil
+}
+
+// decodeVectorB64 decodes a base64-encoded little-endian float32 payload
+// into a []float64, validating each element for NaN/Inf.
+func decodeVectorB64(s string) ([]float64, error) {
+	raw, err := base64.StdEncoding.DecodeString(s)
+	if err != nil {
+		return nil, fmt.Errorf("vector_b64 is not valid base64: %w", err)
+	}
+	if len(raw) == 0 || len(raw)%4 != 0 {
+		return nil, fmt.Errorf("vector_b64 payload length %d is not a positive multiple of 4 bytes (float32)", len(raw))
+	}
+
+	vector := make([]float64, len(raw)/4)
+	for i := range vector {
+		v := float64(math.Float32frombits(binary.LittleEndian.Uint32(raw[i*4:])))
+		if math.IsNaN(v) || math.IsInf(v, 0) {
+			return nil, fmt.Errorf("vector element %d is invalid (NaN or Inf)", i)
+		}
+		vector[i] = v
+	}
+	return vector, nil
+}
+
+// encodeVectorB64 encodes a ciphertext as base64 little-endian float32,
+// the inverse of decodeVectorB64.
+func encodeVectorB64(v []float64) string {
+	raw := make([]byte, len(v)*4)
+	for i, f := range v {
+		binary.LittleEndian.PutUint32(raw[i*4:], math.Float32bits(float32(f)))
+	}
+	return base64.StdEncoding.EncodeToString(raw)
+}
+
+// encryptOne validates and encrypts a single vector using the cached matrix
+// and config. It is shared by the single-vector and batch handlers.
+func (b *vectorBackend) encryptOne(matrix *mat.Dense, cfg *rotationConfig, vector []float64) ([]float64, error) {
 	// Dimension check.
 	if len(vector) != cfg.Dimension {
 		return nil, fmt.Errorf("vector dimension %d does not match configured dimension %d",
@@ -90,11 +170,6 @@ func (b *vectorBackend) handleEncryptVector(ctx context.Context, req *logical.Re
 		return nil, fmt.Errorf("vector magnitude too large")
 	}
 
-	// Audit Logging: Log request metadata (NOT the vector content).
-	b.Logger().Info("vector encryption request",
-		"dimension", cfg.Dimension,
-		"client_id", req.ClientToken)
-
 	// === Memory Pooling: Get buffers from pool ===
 
 	// Input buffer.
@@ -180,11 +255,7 @@ func (b *vectorBackend) handleEncryptVector(ctx context.Context, req *logical.Re
 	resultCiphertext := make([]float64, cfg.Dimension)
 	copy(resultCiphertext, ciphertextBuf)
 
-	return &logical.Response{
-		Data: map[string]interface{}{
-			"ciphertext": resultCiphertext,
-		},
-	}, nil
+	return resultCiphertext, nil
 }
 
 // encryptExists is the ExistenceCheck for the encrypt path.
@@ -301,10 +372,13 @@ different ciphertexts on each call. However, the approximate distance
 between any two encrypted vectors is preserved.
 
 Input:
-  vector - Array of floats (must match configured dimension)
+  vector     - Array of floats (must match configured dimension)
+  vector_b64 - Alternative compact encoding: base64 little-endian
+               float32. Takes precedence over 'vector'.
 
 Output:
-  ciphertext - Array of floats (encrypted vector)
+  ciphertext     - Array of floats (encrypted vector)
+  ciphertext_b64 - Returned instead when the input used vector_b64
 
 Example:
   vault write vector/encrypt/vector vector='[0.1, 0.2, 0.3, ...]'
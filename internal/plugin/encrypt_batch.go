@@ -0,0 +1,170 @@
+// Copyright 2024 The vault-plugin-secrets-vector-dpe Authors
+// SPDX-License-Identifier: Apache-2.0
+
+package plugin
+
+import (
+	"context"
+	"fmt"
+
+	"github.com/hashicorp/vault/sdk/framework"
+	"github.com/hashicorp/vault/sdk/logical"
+)
+
+const (
+	// maxBatchSize bounds the number of vectors per batch request
+	// (DoS mitigation, mirrors the dimension limit in config).
+	maxBatchSize = 1024
+)
+
+// pathEncryptBatch returns the path configuration for encrypt/batch.
+func (b *vectorBackend) pathEncryptBatch() []*framework.Path {
+	return []*framework.Path{
+		{
+			Pattern: "encrypt/batch",
+			Fields: map[string]*framework.FieldSchema{
+				"batch_input": {
+					Type:        framework.TypeSlice,
+					Description: "List of items to encrypt in one request. Each item is an object with a 'vector' key, or a 'vector_b64' key holding base64 little-endian float32.",
+				},
+			},
+			Operations: map[logical.Operation]framework.OperationHandler{
+				logical.CreateOperation: &framework.PathOperation{
+					Callback: b.handleEncryptBatch,
+					Summary:  "Encrypt a batch of vectors in a single request.",
+				},
+				logical.UpdateOperation: &framework.PathOperation{
+					Callback: b.handleEncryptBatch,
+					Summary:  "Encrypt a batch of vectors in a single request.",
+				},
+			},
+			ExistenceCheck:  b.encryptExists,
+			HelpSynopsis:    pathEncryptBatchHelpSyn,
+			HelpDescription: pathEncryptBatchHelpDesc,
+		},
+	}
+}
+
+// handleEncryptBatch encrypts a list of vectors in one round-trip.
+// The response follows the Transit batch convention: batch_results holds
+// one entry per input item, each with either a 'ciphertext' or an 'error'.
+func (b *vectorBackend) handleEncryptBatch(ctx context.Context, req *logical.Request, data *framework.FieldData) (resp *logical.Response, retErr error) {
+	// Panic Safety: Recover from panics (e.g., gonum matrix math or memory issues).
+	defer func() {
+		if r := recover(); r != nil {
+			b.Logger().Error("internal plugin error", "panic", r)
+			retErr = fmt.Errorf("internal plugin error")
+		}
+	}()
+
+	items, err := parseBatchInput(data.Get("batch_input"))
+	if err != nil {
+		return nil, err
+	}
+
+	// Get cached matrix and config once for the whole batch.
+	matrix, cfg, err := b.getMatrixAndConfig(ctx, req.Storage)
+	if err != nil {
+		return nil, err
+	}
+
+	// Audit Logging: Log request metadata (NOT the vector content).
+	b.Logger().Info("vector batch encryption request",
+		"dimension", cfg.Dimension,
+		"batch_size", len(items),
+		"client_id", req.ClientToken)
+
+	batchResults := make([]map[string]interface{}, len(items))
+	for i, item := range items {
+		ciphertext, err := b.encryptOne(matrix, cfg, item.vector)
+		if err != nil {
+			batchResults[i] = map[string]interface{}{"error": err.Error()}
+			continue
+		}
+		// Answer each item in the encoding the caller used.
+		if item.wantB64 {
+			batchResults[i] = map[string]interface{}{"ciphertext_b64": encodeVectorB64(ciphertext)}
+		} else {
+			batchResults[i] = map[string]interface{}{"ciphertext": ciphertext}
+		}
+	}
+
+	return &logical.Response{
+		Data: map[string]interface{}{
+			"batch_results": batchResults,
+		},
+	}, nil
+}
+
+// batchItem is one parsed entry of batch_input, remembering which
+// encoding the caller used so the response can mirror it.
+type batchItem struct {
+	vector  []float64
+	wantB64 bool
+}
+
+// parseBatchInput converts the raw batch_input field into a list of items.
+// Each item must be an object carrying a 'vector' key in any of the formats
+// accepted by parseVector, or a 'vector_b64' key (base64 float32).
+func parseBatchInput(raw interface{}) ([]batchItem, error) {
+	if raw == nil {
+		return nil, fmt.Errorf("batch_input is required")
+	}
+
+	rawItems, ok := raw.([]interface{})
+	if !ok {
+		return nil, fmt.Errorf("batch_input must be an array of objects")
+	}
+	if len(rawItems) == 0 {
+		return nil, fmt.Errorf("batch_input must not be empty")
+	}
+	if len(rawItems) > maxBatchSize {
+		return nil, fmt.Errorf("batch size %d exceeds maximum allowed %d", len(rawItems), maxBatchSize)
+	}
+
+	items := make([]batchItem, len(rawItems))
+	for i, rawItem := range rawItems {
+		obj, ok := rawItem.(map[string]interface{})
+		if !ok {
+			return nil, fmt.Errorf("batch_input item %d is not an object", i)
+		}
+		if b64, ok := obj["vector_b64"].(string); ok && b64 != "" {
+			vector, err := decodeVectorB64(b64)
+			if err != nil {
+				return nil, fmt.Errorf("batch_input item %d: %w", i, err)
+			}
+			items[i] = batchItem{vector: vector, wantB64: true}
+			continue
+		}
+		vector, err := parseVector(obj["vector"])
+		if err != nil {
+			return nil, fmt.Errorf("batch_input item %d: %w", i, err)
+		}
+		items[i] = batchItem{vector: vector}
+	}
+	return items, nil
+}
+
+// Help text constants for the batch encrypt path.
+const pathEncryptBatchHelpSyn = `Encrypt a batch of vector embeddings in a single request.`
+
+const pathEncryptBatchHelpDesc = `
+This endpoint encrypts several vector embeddings in one round-trip using
+the same Scale-And-Perturb (SAP) scheme as encrypt/vector, amortizing the
+HTTP and storage overhead across the batch.
+
+Input:
+  batch_input - Array of objects, each with a 'vector' key holding an
+                array of floats (must match configured dimension) or a
+                'vector_b64' key holding base64 little-endian float32
+
+Output:
+  batch_results - Array with one entry per input item. Each entry holds
+                  a 'ciphertext' (or 'ciphertext_b64' when the item used
+                  vector_b64), or an 'error' describing why that item
+                  failed. Item failures do not abort the rest of the
+                  batch.
+
+Example:
+  vault write vector/encrypt/batch batch_input='[{"vector": [0.1, ...]}, {"vector": [0.2, ...]}]'
+`
@@ -0,0 +1,74 @@
+// Copyright 2024 The vault-plugin-secrets-vector-dpe Authors
+// SPDX-License-Identifier: Apache-2.0
+
+package plugin
+
+import (
+	"testing"
+)
+
+func TestParseBatchInput(t *testing.T) {
+	tests := []struct {
+		name    string
+		input   interface{}
+		wantLen int
+		wantErr bool
+	}{
+		{
+			name: "valid batch",
+			input: []interface{}{
+				map[string]interface{}{"vector": []interface{}{1.0, 2.0}},
+				map[string]interface{}{"vector": []interface{}{3.0, 4.0}},
+			},
+			wantLen: 2,
+			wantErr: false,
+		},
+		{
+			name:    "nil input",
+			input:   nil,
+			wantLen: 0,
+			wantErr: true,
+		},
+		{
+			name:    "empty batch",
+			input:   []interface{}{},
+			wantLen: 0,
+			wantErr: true,
+		},
+		{
+			name:    "item not an object",
+			input:   []interface{}{[]interface{}{1.0, 2.0}},
+			wantLen: 0,
+			wantErr: true,
+		},
+		{
+			name: "b64 item",
+			input: []interface{}{
+				map[string]interface{}{"vector_b64": encodeVectorB64([]float64{1.0, 2.0})},
+			},
+			wantLen: 1,
+			wantErr: false,
+		},
+		{
+			name: "item missing vector",
+			input: []interface{}{
+				map[string]interface{}{"other": []interface{}{1.0}},
+			},
+			wantLen: 0,
+			wantErr: true,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got, err := parseBatchInput(tt.input)
+			if (err != nil) != tt.wantErr {
+				t.Errorf("parseBatchInput() error = %v, wantErr %v", err, tt.wantErr)
+				return
+			}
+			if !tt.wantErr && len(got) != tt.wantLen {
+				t.Errorf("parseBatchInput() len = %v, want %v", len(got), tt.wantLen)
+			}
+		})
+	}
+}
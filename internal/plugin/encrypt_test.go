@@ -67,3 +67,40 @@ func TestParseVector(t *testing.T) {
 	}
 }
 
+func TestVectorB64RoundTrip(t *testing.T) {
+	in := []float64{0.1, 0.5, -0.2, 0.0}
+
+	got, err := decodeVectorB64(encodeVectorB64(in))
+	if err != nil {
+		t.Fatalf("decodeVectorB64() error = %v", err)
+	}
+	if len(got) != len(in) {
+		t.Fatalf("decodeVectorB64() len = %v, want %v", len(got), len(in))
+	}
+	for i := range in {
+		// float32 transport loses precision; compare at float32 accuracy.
+		if diff := math.Abs(got[i] - in[i]); diff > 1e-6 {
+			t.Errorf("element %d = %v, want %v (diff %v)", i, got[i], in[i], diff)
+		}
+	}
+}
+
+func TestDecodeVectorB64Invalid(t *testing.T) {
+	tests := []struct {
+		name  string
+		input string
+	}{
+		{name: "not base64", input: "!!!"},
+		{name: "empty payload", input: ""},
+		{name: "not multiple of 4 bytes", input: "AAA="}, // 2 bytes
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if _, err := decodeVectorB64(tt.input); err == nil {
+				t.Errorf("decodeVectorB64(%q) expected error, got nil", tt.input)
+			}
+		})
+	}
+}
+
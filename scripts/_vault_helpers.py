@@ -0,0 +1,232 @@
+"""Shared helpers for the vault-vector-dpe validation scripts."""
+
+import base64
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import hvac
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson serializes numpy arrays directly and much faster than stdlib
+# json, but it is an optional extra
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def get_logger(name):
+    """Message-only logger for script status output.
+
+    One shared StreamHandler per logger instead of raw print() calls:
+    the sink stays configurable (level, destination, buffering) and
+    output from concurrently running scripts does not interleave
+    mid-line.
+    """
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+def pooled_session(pool_maxsize=16):
+    """Build a requests.Session with a keep-alive connection pool.
+
+    hvac's default adapter opens a fresh TCP+TLS connection per call;
+    injecting this session into hvac.Client(session=...) lets every
+    write in a script reuse one connection. Callers are responsible
+    for closing the session (typically in a finally block).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def wait_vault_ready(url, timeout=5.0, interval=0.05):
+    """Poll sys/health until Vault answers, instead of a fixed sleep.
+
+    Any health status code counts as ready (Vault reports sealed/standby
+    states via 4xx/5xx codes). Raises TimeoutError when the deadline
+    passes without an answer.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            requests.get(f'{url}/v1/sys/health', timeout=0.1)
+            return
+        except requests.RequestException:
+            pass
+        time.sleep(interval)
+    raise TimeoutError(f'Vault at {url} not ready within {timeout:.1f}s')
+
+
+def wait_vault_down(url, timeout=5.0, interval=0.05):
+    """Poll until Vault stops answering, e.g. after a kill.
+
+    Returns quietly on timeout: the caller may be killing a Vault that
+    was already gone, which is not an error.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            requests.get(f'{url}/v1/sys/health', timeout=0.1)
+        except requests.RequestException:
+            return
+        time.sleep(interval)
+
+
+# Mount list per Vault address, fetched once per process. Spares the
+# list_mounted_secrets_engines round-trip on every subsequent check.
+_MOUNTS_CACHE = {}
+
+
+def ensure_mount(client, mount_point, backend_type):
+    """Make sure the secrets engine is mounted, enabling it if missing.
+
+    The mount list is fetched once per Vault address and cached at
+    module level. Authentication problems surface through this first
+    real call, so callers do not need a separate is_authenticated()
+    preflight round-trip.
+    """
+    mounts = _MOUNTS_CACHE.get(client.url)
+    if mounts is None:
+        mounts = client.sys.list_mounted_secrets_engines()['data']
+        _MOUNTS_CACHE[client.url] = mounts
+
+    if f'{mount_point}/' in mounts:
+        return False
+
+    client.sys.enable_secrets_engine(backend_type=backend_type, path=mount_point)
+    mounts[f'{mount_point}/'] = {'type': backend_type}
+    return True
+
+
+def write_payload(client, path, payload):
+    """Write to a Vault path, serializing the body with orjson when present.
+
+    orjson encodes the payload in one C pass and handles numpy arrays
+    natively (OPT_SERIALIZE_NUMPY), so callers can pass ndarrays
+    without a tolist() round-trip. Without orjson this defers to
+    client.write and hvac's stdlib json, converting arrays as needed.
+    """
+    if orjson is not None:
+        return client.adapter.post(
+            f'/v1/{path}',
+            data=orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+            headers={'Content-Type': 'application/json'},
+        )
+    return client.write(path, **{
+        k: v.tolist() if isinstance(v, np.ndarray) else v
+        for k, v in payload.items()
+    })
+
+
+def normal_unit(rng, dim, out=None):
+    """Draw a standard-normal vector and normalize it to unit length.
+
+    Normalization happens in place, avoiding the second temporary the
+    gen-then-divide pattern allocates. Pass ``out`` to reuse a
+    preallocated buffer across calls.
+    """
+    if out is None:
+        out = rng.standard_normal(dim)
+    else:
+        rng.standard_normal(out=out)
+    out /= np.linalg.norm(out)
+    return out
+
+
+def cosine(a, b):
+    """Cosine similarity as dot(a, b) / (|a| * |b|).
+
+    One dot product plus two norms — three passes over the data,
+    versus five for the normalize-both-then-dot pattern (which also
+    allocates two full-size copies).
+    """
+    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+def pack_vector(v):
+    """Encode a vector as base64 little-endian float32 for transport.
+
+    One memcpy instead of per-element JSON float conversion, and a ~4x
+    smaller payload than JSON-encoded doubles.
+    """
+    return base64.b64encode(np.asarray(v, dtype=np.float32).tobytes()).decode()
+
+
+def unpack_ciphertext(b64):
+    """Decode a base64 float32 ciphertext back into a numpy array."""
+    return np.frombuffer(base64.b64decode(b64), dtype=np.float32)
+
+
+def encrypt_vector(client, mount_point, v):
+    """Encrypt one vector, preferring the compact base64 transport.
+
+    Falls back to the documented JSON 'vector' field when the server
+    rejects vector_b64 (older plugin builds).
+    """
+    try:
+        response = write_payload(
+            client,
+            f'{mount_point}/encrypt/vector',
+            {'vector_b64': pack_vector(v)},
+        )
+        return unpack_ciphertext(response['data']['ciphertext_b64'])
+    except hvac.exceptions.InvalidRequest:
+        response = write_payload(
+            client,
+            f'{mount_point}/encrypt/vector',
+            {'vector': np.asarray(v)},
+        )
+        return np.array(response['data']['ciphertext'])
+
+
+def encrypt_batch(client, mount_point, vectors):
+    """Encrypt several vectors in one round-trip via encrypt/batch.
+
+    Posts a Transit-style ``batch_input`` payload so N vectors cost one
+    HTTPS round-trip instead of N. Falls back to concurrent per-vector
+    encrypt/vector calls when the server does not expose the batch
+    endpoint (404 on older plugin builds).
+
+    Returns a list of ciphertexts as numpy arrays, in input order.
+    """
+    batch_input = [{'vector_b64': pack_vector(v)} for v in vectors]
+    try:
+        response = write_payload(
+            client,
+            f'{mount_point}/encrypt/batch',
+            {'batch_input': batch_input},
+        )
+    except hvac.exceptions.InvalidPath:
+        # Older plugin without the batch endpoint: the per-vector calls
+        # are independent and I/O-bound, so issue them in parallel.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return list(executor.map(
+                lambda v: encrypt_vector(client, mount_point, v), vectors))
+
+    ciphertexts = []
+    for i, result in enumerate(response['data']['batch_results']):
+        if result.get('error'):
+            raise RuntimeError(f"batch item {i} failed: {result['error']}")
+        if 'ciphertext_b64' in result:
+            ciphertexts.append(unpack_ciphertext(result['ciphertext_b64']))
+        else:
+            ciphertexts.append(np.array(result['ciphertext']))
+    return ciphertexts
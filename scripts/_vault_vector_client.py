@@ -0,0 +1,76 @@
+"""Thin client wrapper around hvac for the vector-dpe secrets engine."""
+
+import hvac
+import numpy as np
+
+from _vault_helpers import encrypt_batch, encrypt_vector, ensure_mount
+
+
+class VectorClient:
+    """An hvac.Client plus mount and config bookkeeping for one mount.
+
+    The configured (dimension, scaling_factor, approximation_factor)
+    tuple is memoized per mount at class level, so repeated
+    ensure_config() calls with unchanged parameters skip the
+    config/rotate round-trip (which would also needlessly rotate the
+    key and invalidate previously encrypted vectors).
+    """
+
+    _cfg_cache = {}
+
+    def __init__(self, url, token, mount, session=None):
+        self.mount = mount
+        self._session = session
+        self.client = hvac.Client(url=url, token=token, session=session)
+
+    def ensure_mount(self, backend_type):
+        """Enable the secrets engine at this mount if it is missing."""
+        return ensure_mount(self.client, self.mount, backend_type)
+
+    def ensure_config(self, dimension, scaling_factor, approximation_factor):
+        """Issue config/rotate only when the parameters change."""
+        key = (dimension, scaling_factor, approximation_factor)
+        if self._cfg_cache.get(self.mount) == key:
+            return
+        self.client.write(
+            f'{self.mount}/config/rotate',
+            dimension=dimension,
+            scaling_factor=scaling_factor,
+            approximation_factor=approximation_factor,
+        )
+        self._cfg_cache[self.mount] = key
+
+    def encrypt(self, vector):
+        """Encrypt one vector (see _vault_helpers.encrypt_vector)."""
+        return encrypt_vector(self.client, self.mount, vector)
+
+    def encrypt_batch(self, vectors):
+        """Encrypt several vectors (see _vault_helpers.encrypt_batch)."""
+        return encrypt_batch(self.client, self.mount, vectors)
+
+    def drift_stats(self, rng, dim, k=32):
+        """Cosine-similarity drift statistics over k random unit vectors.
+
+        Generates a (k, dim) matrix of unit plaintexts, encrypts it in
+        one batch, and compares the full plaintext and ciphertext
+        similarity matrices — two BLAS matmuls covering k*(k-1)/2 pairs
+        instead of a single fragile sample.
+
+        Returns (mean_drift, max_drift, plaintexts, ciphertexts) so
+        callers can reuse rows for further checks.
+        """
+        plaintexts = rng.standard_normal((k, dim))
+        plaintexts /= np.linalg.norm(plaintexts, axis=1, keepdims=True)
+        sim_plain = plaintexts @ plaintexts.T
+
+        ciphertexts = np.stack(self.encrypt_batch(plaintexts))
+        normalized = ciphertexts / np.linalg.norm(ciphertexts, axis=1, keepdims=True)
+        sim_cipher = normalized @ normalized.T
+
+        drift = np.abs(sim_plain - sim_cipher)[np.triu_indices(k, 1)]
+        return float(drift.mean()), float(drift.max()), plaintexts, ciphertexts
+
+    def close(self):
+        """Close the injected session, if any."""
+        if self._session is not None:
+            self._session.close()
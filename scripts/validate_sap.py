@@ -1,118 +1,98 @@
-import hvac
 import numpy as np
+import os
 import sys
 import time
 
+from _vault_helpers import get_logger, pooled_session
+from _vault_vector_client import VectorClient
+
+log = get_logger(__name__)
+
 # Configuration
 VAULT_URL = 'http://127.0.0.1:8200'
 VAULT_TOKEN = 'root'
-MOUNT_POINT = 'he-vector'
+# Overridable so CI can run the validation scripts in parallel against
+# separate mounts (config state is per-mount)
+MOUNT_POINT = os.environ.get('MOUNT_POINT', 'he-vector')
 PLUGIN_NAME = 'vector-dpe'
 DIMENSION = 1536
 # Test Parameters
 TEST_SCALING_FACTOR = 10.0
 TEST_APPROX_FACTOR = 2.0
 
-def main():
-    client = hvac.Client(url=VAULT_URL, token=VAULT_TOKEN)
-    
-    if not client.is_authenticated():
-        print(f"❌ Authentication failed: Unable to authenticate to {VAULT_URL}")
-        sys.exit(1)
-    
-    print(f"✅ Connected to Vault at {VAULT_URL}")
+# Seeded generator for reproducible test vectors
+RNG = np.random.default_rng(42)
 
-    # Ensure Plugin Enabled
+def run_checks(vc):
+    # Ensure Plugin Enabled (this first call also surfaces auth failures)
     try:
-        secrets_engines = client.sys.list_mounted_secrets_engines()['data']
-        if f"{MOUNT_POINT}/" not in secrets_engines:
-            client.sys.enable_secrets_engine(
-                backend_type=PLUGIN_NAME,
-                path=MOUNT_POINT,
-            )
-            print(f"✅ Enabled secrets engine at {MOUNT_POINT}/")
+        if vc.ensure_mount(PLUGIN_NAME):
+            log.info(f"✅ Enabled secrets engine at {MOUNT_POINT}/")
+        log.info(f"✅ Connected to Vault at {VAULT_URL}")
     except Exception as e:
-        print(f"⚠️  Assuming plugin enabled or error checking: {e}")
+        log.info(f"⚠️  Assuming plugin enabled or error checking: {e}")
 
     # Configure Plugin
-    print(f"⚙️  Configuring plugin (dim={DIMENSION}, s={TEST_SCALING_FACTOR}, beta={TEST_APPROX_FACTOR})...")
+    log.info(f"⚙️  Configuring plugin (dim={DIMENSION}, s={TEST_SCALING_FACTOR}, beta={TEST_APPROX_FACTOR})...")
     try:
-        client.write(f'{MOUNT_POINT}/config/rotate', 
-                     dimension=DIMENSION, 
-                     scaling_factor=TEST_SCALING_FACTOR, 
-                     approximation_factor=TEST_APPROX_FACTOR)
-        print(f"✅ Configuration successful")
+        vc.ensure_config(DIMENSION, TEST_SCALING_FACTOR, TEST_APPROX_FACTOR)
+        log.info(f"✅ Configuration successful")
     except Exception as e:
-        print(f"❌ Failed to configure plugin: {e}")
+        log.info(f"❌ Failed to configure plugin: {e}")
         sys.exit(1)
 
     # --- Check 1: Probabilistic Encryption ---
-    print(f"\n🧪 [Check 1] Probabilistic Encryption (CPA Resistance)")
-    vec_prob = np.random.normal(0, 1, DIMENSION)
+    log.info(f"\n🧪 [Check 1] Probabilistic Encryption (CPA Resistance)")
+    vec_prob = RNG.standard_normal(DIMENSION)
     
     try:
-        resp_1 = client.write(f'{MOUNT_POINT}/encrypt/vector', vector=vec_prob.tolist())
-        resp_2 = client.write(f'{MOUNT_POINT}/encrypt/vector', vector=vec_prob.tolist())
-        
-        c1 = np.array(resp_1['data']['ciphertext'])
-        c2 = np.array(resp_2['data']['ciphertext'])
-        
+        # Encrypt the same vector twice (one batched round-trip)
+        c1, c2 = vc.encrypt_batch([vec_prob, vec_prob])
+
         if not np.allclose(c1, c2):
-            print(f"   ✅ PASS: Ciphertexts are different (Noise is active)")
+            log.info(f"   ✅ PASS: Ciphertexts are different (Noise is active)")
         else:
-            print(f"   ❌ FAIL: Ciphertexts are identical (Deterministic encryption detected)")
+            log.info(f"   ❌ FAIL: Ciphertexts are identical (Deterministic encryption detected)")
             sys.exit(1)
     except Exception as e:
-        print(f"   ❌ Error: {e}")
+        log.info(f"   ❌ Error: {e}")
         sys.exit(1)
 
     # --- Check 2: Approximate Utility (Drift) ---
-    print(f"\n🧪 [Check 2] Approximate Utility (Drift Analysis)")
-    
-    # Generate similar vectors
-    vec_a = np.random.normal(0, 1, DIMENSION)
-    vec_a = vec_a / np.linalg.norm(vec_a)
-    
-    noise = np.random.normal(0, 0.2, DIMENSION)
-    vec_b = vec_a + noise
-    vec_b = vec_b / np.linalg.norm(vec_b)
-    
-    sim_plain = np.dot(vec_a, vec_b)
-    
+    log.info(f"\n🧪 [Check 2] Approximate Utility (Drift Analysis)")
+
+    # Statistical version of the drift check: all pairs among k random
+    # unit vectors instead of one hand-picked pair
+    k = 32
+
     try:
-        resp_a = client.write(f'{MOUNT_POINT}/encrypt/vector', vector=vec_a.tolist())
-        resp_b = client.write(f'{MOUNT_POINT}/encrypt/vector', vector=vec_b.tolist())
-        
-        enc_a = np.array(resp_a['data']['ciphertext'])
-        enc_b = np.array(resp_b['data']['ciphertext'])
-        
-        # Normalize ciphertext for Cosine Similarity
-        enc_a_norm = enc_a / np.linalg.norm(enc_a)
-        enc_b_norm = enc_b / np.linalg.norm(enc_b)
-        
-        sim_cipher = np.dot(enc_a_norm, enc_b_norm)
-        drift = abs(sim_plain - sim_cipher)
-        
-        print(f"   Plaintext Similarity: {sim_plain:.6f}")
-        print(f"   Ciphertext Similarity: {sim_cipher:.6f}")
-        print(f"   Drift: {drift:.6f}")
-        
-        if 0.0 < drift < 0.1:
-            print(f"   ✅ PASS: Drift is small but non-zero (Approximate DPE)")
-        elif drift == 0.0:
-            print(f"   ❌ FAIL: Drift is exactly zero (Noise missing?)")
+        mean_drift, max_drift, plaintexts, ciphertexts = vc.drift_stats(RNG, DIMENSION, k=k)
+
+        log.info(f"   Pairs compared: {k * (k - 1) // 2}")
+        log.info(f"   Mean Drift: {mean_drift:.6f}")
+        log.info(f"   Max Drift: {max_drift:.6f}")
+
+        if 0.0 < mean_drift < 0.05:
+            log.info(f"   ✅ PASS: Drift is small but non-zero (Approximate DPE)")
+        elif mean_drift == 0.0:
+            log.info(f"   ❌ FAIL: Drift is exactly zero (Noise missing?)")
             sys.exit(1)
         else:
-            print(f"   ❌ FAIL: Drift too large ({drift:.4f})")
+            log.info(f"   ❌ FAIL: Mean drift too large ({mean_drift:.4f})")
             sys.exit(1)
-            
+
     except Exception as e:
-        print(f"   ❌ Error: {e}")
+        log.info(f"   ❌ Error: {e}")
         sys.exit(1)
 
     # --- Check 3: Scaling Factor Compliance ---
-    print(f"\n🧪 [Check 3] Scaling Factor Compliance (s={TEST_SCALING_FACTOR})")
-    
+    log.info(f"\n🧪 [Check 3] Scaling Factor Compliance (s={TEST_SCALING_FACTOR})")
+
+    # Any pair from the drift batch works: the scaling ratio does not
+    # depend on the vectors being similar
+    vec_a, vec_b = plaintexts[0], plaintexts[1]
+    enc_a, enc_b = ciphertexts[0], ciphertexts[1]
+
     dist_plain = np.linalg.norm(vec_a - vec_b)
     dist_cipher = np.linalg.norm(enc_a - enc_b)
     
@@ -121,18 +101,26 @@ def main():
     ratio = dist_cipher / dist_plain
     expected_ratio = TEST_SCALING_FACTOR
     
-    print(f"   Plaintext Distance: {dist_plain:.6f}")
-    print(f"   Ciphertext Distance: {dist_cipher:.6f}")
-    print(f"   Observed Scaling Ratio: {ratio:.4f} (Expected ~{expected_ratio})")
+    log.info(f"   Plaintext Distance: {dist_plain:.6f}")
+    log.info(f"   Ciphertext Distance: {dist_cipher:.6f}")
+    log.info(f"   Observed Scaling Ratio: {ratio:.4f} (Expected ~{expected_ratio})")
     
     # Allow 20% variance due to noise
     if abs(ratio - expected_ratio) < 0.2 * expected_ratio:
-        print(f"   ✅ PASS: Scaling factor applied correctly")
+        log.info(f"   ✅ PASS: Scaling factor applied correctly")
     else:
-        print(f"   ❌ FAIL: Scaling ratio mismatch")
+        log.info(f"   ❌ FAIL: Scaling ratio mismatch")
         sys.exit(1)
 
-    print(f"\n🎉 ALL SAP CHECKS PASSED!")
+    log.info(f"\n🎉 ALL SAP CHECKS PASSED!")
+
+def main():
+    # Reuse one pooled keep-alive connection across all checks.
+    vc = VectorClient(VAULT_URL, VAULT_TOKEN, MOUNT_POINT, session=pooled_session())
+    try:
+        run_checks(vc)
+    finally:
+        vc.close()
 
 if __name__ == "__main__":
     main()
@@ -23,23 +23,38 @@ Usage:
 import subprocess
 import sys
 import os
-import time
 import json
 import hashlib
+import logging
 
 # Try to import optional dependencies
 try:
     import hvac
     import numpy as np
+    from _vault_helpers import (
+        encrypt_batch,
+        get_logger,
+        normal_unit,
+        pooled_session,
+        wait_vault_down,
+        wait_vault_ready,
+    )
     HAS_DEPS = True
 except ImportError:
     HAS_DEPS = False
 
+# Status output goes through logging so the sink stays configurable
+if HAS_DEPS:
+    log = get_logger(__name__)
+else:
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    log = logging.getLogger(__name__)
+
 # Configuration
 VAULT_URL = os.environ.get('VAULT_ADDR', 'http://127.0.0.1:8200')
 VAULT_TOKEN = os.environ.get('VAULT_TOKEN', 'root')
 PLUGIN_NAME = 'vault-plugin-secrets-vector-dpe'
-MOUNT_POINT = 'vector-test'
+MOUNT_POINT = os.environ.get('MOUNT_POINT', 'vector-test')
 BUILD_DIR = './cmd/vault-plugin-secrets-vector-dpe'
 # Plugin dir is relative to the script location (repo root)
 PLUGIN_DIR = os.environ.get('VAULT_PLUGIN_DIR', None)  # Will be set to absolute path
@@ -49,27 +64,95 @@ TEST_DIMENSION = 1536
 TEST_SCALING_FACTOR = 10.0
 TEST_APPROX_FACTOR = 5.0
 
+# Seeded generator for reproducible test vectors
+RNG = np.random.default_rng(42) if HAS_DEPS else None
+
+
+def check(cond: bool, msg: str):
+    """Fail the run with a message unless cond holds.
+
+    Unlike ``assert``, this survives ``python -O`` (which strips assert
+    statements silently), so the validation still runs when the script
+    is baked into an optimized container image.
+    """
+    if not cond:
+        log.info(f"    ❌ {msg}")
+        sys.exit(1)
+
 
 def run_cmd(cmd: list, check: bool = True, capture: bool = True) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result."""
-    print(f"  $ {' '.join(cmd)}")
+    """Run a shell command and return the result.
+
+    Output is captured as raw bytes and only decoded on the error path;
+    callers here never read it on success, so the UTF-8 decode and
+    string allocation would be wasted work.
+    """
+    log.info(f"  $ {' '.join(cmd)}")
     result = subprocess.run(
         cmd,
-        capture_output=capture,
-        text=True,
+        stdout=subprocess.PIPE if capture else None,
+        stderr=subprocess.PIPE if capture else None,
         check=False
     )
     if check and result.returncode != 0:
-        print(f"    ❌ Command failed: {result.stderr or result.stdout}")
+        detail = (result.stderr or result.stdout or b'').decode('utf-8', errors='replace')
+        log.info(f"    ❌ Command failed: {detail}")
         sys.exit(1)
     return result
 
 
+def sha256_file(path: str) -> str:
+    """SHA256 of a file without loading it into memory at once.
+
+    Uses hashlib.file_digest (3.11+) which streams straight from the
+    file descriptor; falls back to chunked updates on older Pythons.
+    """
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+# Cache file for binary hashes, relative to the repo root (the scripts
+# chdir there before building)
+BUILD_CACHE_PATH = '.build-cache.json'
+
+
+def cached_sha256(path: str) -> str:
+    """SHA256 of a file, cached by (mtime_ns, size) in .build-cache.json.
+
+    go build leaves the binary untouched when its inputs are unchanged,
+    so on repeat runs the stored hash can be reused instead of
+    re-reading a multi-MB file.
+    """
+    st = os.stat(path)
+    try:
+        with open(BUILD_CACHE_PATH) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+
+    entry = cache.get(path)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+
+    sha256 = sha256_file(path)
+    cache[path] = [st.st_mtime_ns, st.st_size, sha256]
+    tmp_path = BUILD_CACHE_PATH + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, BUILD_CACHE_PATH)  # atomic swap
+    return sha256
+
+
 def phase_1_build(script_dir: str):
     """Phase 1: Build the plugin binary."""
-    print("\n" + "=" * 60)
-    print("📦 PHASE 1: Build Plugin Binary")
-    print("=" * 60)
+    log.info("\n" + "=" * 60)
+    log.info("📦 PHASE 1: Build Plugin Binary")
+    log.info("=" * 60)
 
     # Use absolute path for plugin directory (at repo root)
     plugin_dir = PLUGIN_DIR or os.path.join(script_dir, 'bin')
@@ -80,38 +163,37 @@ def phase_1_build(script_dir: str):
     result = run_cmd(['go', 'build', '-o', binary_path, './cmd/vault-plugin-secrets-vector-dpe'], check=True)
     
     if not os.path.exists(binary_path):
-        print(f"    ❌ Binary not found at {binary_path}")
+        log.info(f"    ❌ Binary not found at {binary_path}")
         sys.exit(1)
     
-    # Calculate SHA256
-    with open(binary_path, 'rb') as f:
-        sha256 = hashlib.sha256(f.read()).hexdigest()
-    
-    print(f"    ✅ Built: {binary_path}")
-    print(f"    ✅ SHA256: {sha256}")
+    # Calculate SHA256 (cached across runs while the binary is unchanged)
+    sha256 = cached_sha256(binary_path)
+
+    log.info(f"    ✅ Built: {binary_path}")
+    log.info(f"    ✅ SHA256: {sha256}")
     
     # Kill any running Vault so it picks up the new binary
-    print("    🔄 Restarting Vault to pick up new binary...")
+    log.info("    🔄 Restarting Vault to pick up new binary...")
     run_cmd(['pkill', '-f', 'vault server'], check=False)
-    time.sleep(2)
-    
+    wait_vault_down(VAULT_URL)
+
     return binary_path, sha256, plugin_dir
 
 
 def phase_2_register(sha256: str, plugin_dir: str):
     """Phase 2: Register the plugin with Vault."""
-    print("\n" + "=" * 60)
-    print("🔌 PHASE 2: Register Plugin with Vault")
-    print("=" * 60)
+    log.info("\n" + "=" * 60)
+    log.info("🔌 PHASE 2: Register Plugin with Vault")
+    log.info("=" * 60)
 
     # Check Vault status
     result = run_cmd(['vault', 'status'], check=False)
     if result.returncode != 0:
-        print("    ⚠️  Vault is not running. Attempting to start...")
+        log.info("    ⚠️  Vault is not running. Attempting to start...")
         # Kill any existing vault and restart with fresh binary
         run_cmd(['pkill', '-f', 'vault server'], check=False)
-        time.sleep(2)
-        
+        wait_vault_down(VAULT_URL)
+
         # Start Vault in background with absolute path to plugin dir
         env = os.environ.copy()
         env['VAULT_DEV_ROOT_TOKEN_ID'] = 'root'
@@ -122,14 +204,18 @@ def phase_2_register(sha256: str, plugin_dir: str):
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
-        time.sleep(3)
-        
+        try:
+            wait_vault_ready(VAULT_URL)
+        except TimeoutError:
+            log.info("    ❌ Failed to start Vault")
+            sys.exit(1)
+
         result = run_cmd(['vault', 'status'], check=False)
         if result.returncode != 0:
-            print("    ❌ Failed to start Vault")
+            log.info("    ❌ Failed to start Vault")
             sys.exit(1)
     
-    print("    ✅ Vault is running")
+    log.info("    ✅ Vault is running")
 
     # Deregister if exists (ignore errors)
     run_cmd(['vault', 'secrets', 'disable', f'{MOUNT_POINT}/'], check=False)
@@ -142,7 +228,7 @@ def phase_2_register(sha256: str, plugin_dir: str):
         f'-command={PLUGIN_NAME}',
         'secret', PLUGIN_NAME
     ], check=True)
-    print(f"    ✅ Plugin registered: {PLUGIN_NAME}")
+    log.info(f"    ✅ Plugin registered: {PLUGIN_NAME}")
 
     # Enable secrets engine
     run_cmd([
@@ -150,14 +236,14 @@ def phase_2_register(sha256: str, plugin_dir: str):
         f'-path={MOUNT_POINT}',
         PLUGIN_NAME
     ], check=True)
-    print(f"    ✅ Secrets engine enabled at: {MOUNT_POINT}/")
+    log.info(f"    ✅ Secrets engine enabled at: {MOUNT_POINT}/")
 
 
 def phase_3_configure(client: 'hvac.Client'):
     """Phase 3: Configure the plugin via config/rotate."""
-    print("\n" + "=" * 60)
-    print("⚙️  PHASE 3: Configure Plugin (config/rotate)")
-    print("=" * 60)
+    log.info("\n" + "=" * 60)
+    log.info("⚙️  PHASE 3: Configure Plugin (config/rotate)")
+    log.info("=" * 60)
 
     try:
         response = client.write(
@@ -166,141 +252,144 @@ def phase_3_configure(client: 'hvac.Client'):
             scaling_factor=TEST_SCALING_FACTOR,
             approximation_factor=TEST_APPROX_FACTOR
         )
-        print(f"    ✅ Configuration successful")
-        print(f"       dimension: {response['data']['dimension']}")
-        print(f"       scaling_factor: {response['data']['scaling_factor']}")
-        print(f"       approximation_factor: {response['data']['approximation_factor']}")
-        
+        data = response['data']
+        log.info(f"    ✅ Configuration successful")
+        log.info(f"       dimension: {data['dimension']}")
+        log.info(f"       scaling_factor: {data['scaling_factor']}")
+        log.info(f"       approximation_factor: {data['approximation_factor']}")
+
         # Verify response matches input
-        assert response['data']['dimension'] == TEST_DIMENSION, "Dimension mismatch"
-        assert response['data']['scaling_factor'] == TEST_SCALING_FACTOR, "Scaling factor mismatch"
-        assert response['data']['approximation_factor'] == TEST_APPROX_FACTOR, "Approx factor mismatch"
-        
+        check(data['dimension'] == TEST_DIMENSION, "Dimension mismatch")
+        check(data['scaling_factor'] == TEST_SCALING_FACTOR, "Scaling factor mismatch")
+        check(data['approximation_factor'] == TEST_APPROX_FACTOR, "Approx factor mismatch")
+
     except Exception as e:
-        print(f"    ❌ Configuration failed: {e}")
+        log.info(f"    ❌ Configuration failed: {e}")
         sys.exit(1)
 
 
 def phase_4_encrypt(client: 'hvac.Client'):
-    """Phase 4: Encrypt a sample vector and validate output."""
-    print("\n" + "=" * 60)
-    print("🔒 PHASE 4: Encrypt Vector (encrypt/vector)")
-    print("=" * 60)
-
-    # Generate a random normalized vector (like a real embedding)
-    np.random.seed(42)  # For reproducibility in testing
-    sample_vector = np.random.normal(0, 1, TEST_DIMENSION)
-    sample_vector = sample_vector / np.linalg.norm(sample_vector)  # Normalize
-    
-    print(f"    📊 Input vector: dim={len(sample_vector)}, norm={np.linalg.norm(sample_vector):.4f}")
-    
+    """Phase 4: Encrypt a batch of sample vectors and validate output."""
+    log.info("\n" + "=" * 60)
+    log.info("🔒 PHASE 4: Encrypt Vectors (encrypt/vector)")
+    log.info("=" * 60)
+
+    # Generate a batch of random normalized vectors (like real embeddings);
+    # row 0 doubles as the sample vector reused by later phases
+    batch_size = 8
+    plaintexts = RNG.standard_normal((batch_size, TEST_DIMENSION))
+    plaintexts /= np.linalg.norm(plaintexts, axis=1, keepdims=True)
+    sample_vector = plaintexts[0]
+
+    log.info(f"    📊 Input: {batch_size} vectors, dim={TEST_DIMENSION}, norm={np.linalg.norm(sample_vector):.4f}")
+
     try:
-        response = client.write(
-            f'{MOUNT_POINT}/encrypt/vector',
-            vector=sample_vector.tolist()
-        )
-        
-        ciphertext = np.array(response['data']['ciphertext'])
-        
-        print(f"    ✅ Encryption successful")
-        print(f"       Output dimension: {len(ciphertext)}")
-        print(f"       Output norm: {np.linalg.norm(ciphertext):.4f}")
-        print(f"       First 3 values: {ciphertext[:3]}")
-        
+        ciphertexts = np.stack(encrypt_batch(client, MOUNT_POINT, plaintexts))
+        ciphertext = ciphertexts[0]
+
+        log.info(f"    ✅ Encryption successful")
+        log.info(f"       Output shape: {ciphertexts.shape}")
+        log.info(f"       Output norm: {np.linalg.norm(ciphertext):.4f}")
+        log.info(f"       First 3 values: {ciphertext[:3]}")
+
+        # The checks below sweep the whole stacked batch in single
+        # vectorized passes rather than once per ciphertext.
+
         # Validation 1: Correct dimension
-        assert len(ciphertext) == TEST_DIMENSION, f"Output dimension {len(ciphertext)} != {TEST_DIMENSION}"
-        print(f"    ✅ Dimension check: PASS")
-        
-        # Validation 2: All values are valid floats (not NaN/Inf)
-        assert not np.any(np.isnan(ciphertext)), "Output contains NaN"
-        assert not np.any(np.isinf(ciphertext)), "Output contains Inf"
-        print(f"    ✅ Float validity check: PASS")
-        
-        # Validation 3: Output is different from input (encryption happened)
-        assert not np.allclose(ciphertext, sample_vector), "Ciphertext equals plaintext!"
-        print(f"    ✅ Encryption transformation check: PASS")
-        
+        check(ciphertexts.shape == (batch_size, TEST_DIMENSION),
+              f"Output shape {ciphertexts.shape} != ({batch_size}, {TEST_DIMENSION})")
+        log.info(f"    ✅ Dimension check: PASS")
+
+        # Validation 2: All values are valid floats (single isfinite pass
+        # covers both NaN and Inf instead of two separate traversals)
+        check(np.isfinite(ciphertexts).all(), "Output contains NaN or Inf")
+        log.info(f"    ✅ Float validity check: PASS")
+
+        # Validation 3: Every output differs from its input (encryption happened)
+        check(np.any(np.abs(ciphertexts - plaintexts) > 1e-8, axis=1).all(),
+              "A ciphertext equals its plaintext!")
+        log.info(f"    ✅ Encryption transformation check: PASS")
+
         return sample_vector, ciphertext
-        
+
     except Exception as e:
-        print(f"    ❌ Encryption failed: {e}")
+        log.info(f"    ❌ Encryption failed: {e}")
         sys.exit(1)
 
 
 def phase_5_probabilistic_check(client: 'hvac.Client', sample_vector):
     """Phase 5: Verify probabilistic encryption (C1 != C2)."""
-    print("\n" + "=" * 60)
-    print("🎲 PHASE 5: Probabilistic Encryption Check")
-    print("=" * 60)
+    log.info("\n" + "=" * 60)
+    log.info("🎲 PHASE 5: Probabilistic Encryption Check")
+    log.info("=" * 60)
 
     try:
-        # Encrypt the same vector twice
-        resp1 = client.write(f'{MOUNT_POINT}/encrypt/vector', vector=sample_vector.tolist())
-        resp2 = client.write(f'{MOUNT_POINT}/encrypt/vector', vector=sample_vector.tolist())
-        
-        c1 = np.array(resp1['data']['ciphertext'])
-        c2 = np.array(resp2['data']['ciphertext'])
-        
+        # Encrypt the same vector twice (one batched round-trip)
+        c1, c2 = encrypt_batch(client, MOUNT_POINT, [sample_vector, sample_vector])
+
         # They should be different
         if np.allclose(c1, c2):
-            print(f"    ❌ FAIL: Ciphertexts are identical (deterministic encryption!)")
+            log.info(f"    ❌ FAIL: Ciphertexts are identical (deterministic encryption!)")
             sys.exit(1)
         
         # But not wildly different (noise is bounded)
         diff_norm = np.linalg.norm(c1 - c2)
-        print(f"    ✅ PASS: C1 ≠ C2 (diff norm: {diff_norm:.4f})")
-        print(f"       This confirms probabilistic encryption is working.")
+        log.info(f"    ✅ PASS: C1 ≠ C2 (diff norm: {diff_norm:.4f})")
+        log.info(f"       This confirms probabilistic encryption is working.")
         
     except Exception as e:
-        print(f"    ❌ Check failed: {e}")
+        log.info(f"    ❌ Check failed: {e}")
         sys.exit(1)
 
 
 def phase_6_readme_validation(client: 'hvac.Client'):
     """Phase 6: Verify README examples work."""
-    print("\n" + "=" * 60)
-    print("📖 PHASE 6: README Example Validation")
-    print("=" * 60)
+    log.info("\n" + "=" * 60)
+    log.info("📖 PHASE 6: README Example Validation")
+    log.info("=" * 60)
+
+    # Test the exact example from README (sparse vector built as one
+    # zeroed numpy buffer instead of a 1536-element Python list)
+    readme_vector = np.zeros(TEST_DIMENSION)
+    readme_vector[:3] = (0.1, 0.5, -0.2)
 
-    # Test the exact example from README
-    readme_vector = [0.1, 0.5, -0.2] + [0.0] * (TEST_DIMENSION - 3)
-    
     try:
         response = client.write(
             f'{MOUNT_POINT}/encrypt/vector',
-            vector=readme_vector
+            vector=readme_vector.tolist()
         )
         
-        ciphertext = response['data']['ciphertext']
-        
         # Check response format matches README
-        assert 'ciphertext' in response['data'], "Response missing 'ciphertext' key"
-        assert isinstance(ciphertext, list), "Ciphertext is not a list"
-        assert len(ciphertext) == TEST_DIMENSION, "Ciphertext dimension mismatch"
-        
-        print(f"    ✅ README example format validated")
-        print(f"       Response contains 'ciphertext' key: ✓")
-        print(f"       Ciphertext is array of floats: ✓")
-        print(f"       Dimension matches configured: ✓")
+        data = response['data']
+        check('ciphertext' in data, "Response missing 'ciphertext' key")
+
+        ciphertext = data['ciphertext']
+        check(isinstance(ciphertext, list), "Ciphertext is not a list")
+        check(len(ciphertext) == TEST_DIMENSION, "Ciphertext dimension mismatch")
+
+        log.info(f"    ✅ README example format validated")
+        log.info(f"       Response contains 'ciphertext' key: ✓")
+        log.info(f"       Ciphertext is array of floats: ✓")
+        log.info(f"       Dimension matches configured: ✓")
         
     except Exception as e:
-        print(f"    ❌ README validation failed: {e}")
+        log.info(f"    ❌ README validation failed: {e}")
         sys.exit(1)
 
 
 def main():
-    print("=" * 60)
-    print("🚀 vault-vector-dpe Release Verification Script")
-    print("=" * 60)
-    print(f"Vault URL: {VAULT_URL}")
-    print(f"Plugin: {PLUGIN_NAME}")
-    print(f"Mount Point: {MOUNT_POINT}")
+    log.info("=" * 60)
+    log.info("🚀 vault-vector-dpe Release Verification Script")
+    log.info("=" * 60)
+    log.info(f"Vault URL: {VAULT_URL}")
+    log.info(f"Plugin: {PLUGIN_NAME}")
+    log.info(f"Mount Point: {MOUNT_POINT}")
 
     # Check dependencies
     if not HAS_DEPS:
-        print("\n⚠️  Missing Python dependencies. Installing...")
+        log.info("\n⚠️  Missing Python dependencies. Installing...")
         subprocess.run([sys.executable, '-m', 'pip', 'install', 'hvac', 'numpy', '-q'], check=True)
-        print("   Please re-run this script.")
+        log.info("   Please re-run this script.")
         sys.exit(0)
 
     # Change to repo root directory
@@ -308,6 +397,7 @@ def main():
     script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # Go up from scripts/
     os.chdir(script_dir)
 
+    session = None
     try:
         # Phase 1: Build
         binary_path, sha256, plugin_dir = phase_1_build(script_dir)
@@ -315,10 +405,12 @@ def main():
         # Phase 2: Register (already in repo root)
         phase_2_register(sha256, plugin_dir)
 
-        # Initialize hvac client
-        client = hvac.Client(url=VAULT_URL, token=VAULT_TOKEN)
+        # Initialize hvac client with a pooled keep-alive session so all
+        # phases reuse one TCP connection
+        session = pooled_session()
+        client = hvac.Client(url=VAULT_URL, token=VAULT_TOKEN, session=session)
         if not client.is_authenticated():
-            print(f"\n❌ Cannot authenticate to Vault at {VAULT_URL}")
+            log.info(f"\n❌ Cannot authenticate to Vault at {VAULT_URL}")
             sys.exit(1)
 
         # Phase 3: Configure
@@ -334,10 +426,10 @@ def main():
         phase_6_readme_validation(client)
 
         # Success!
-        print("\n" + "=" * 60)
-        print("🎉 ALL VERIFICATION CHECKS PASSED!")
-        print("=" * 60)
-        print(f"""
+        log.info("\n" + "=" * 60)
+        log.info("🎉 ALL VERIFICATION CHECKS PASSED!")
+        log.info("=" * 60)
+        log.info(f"""
 Summary:
   ✅ Plugin builds successfully
   ✅ Plugin registers with Vault
@@ -351,6 +443,8 @@ The plugin is ready for release! 🚀
 """)
 
     finally:
+        if session is not None:
+            session.close()
         os.chdir(original_dir)
 
 